@@ -6,29 +6,137 @@ If face recognition fails, it activates RFID backup authentication.
 Includes buzzer feedback on GPIO pin 26.
 """
 
+import asyncio
+import logging
 import subprocess
 import sys
 import os
 import time
 import threading
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
-from gpiozero import Button, Buzzer
-from signal import pause
+
+# Status output goes through logging - set BTN_LOGLEVEL=INFO to see it. The
+# default keeps the button/auth path quiet on slow (serial) consoles.
+# An unknown level name would make basicConfig raise and keep the controller
+# from starting, so fall back to WARNING (getLevelName maps known names to ints)
+_log_level_name = (os.environ.get("BTN_LOGLEVEL") or "WARNING").upper()
+_log_level = logging.getLevelName(_log_level_name)
+_log_level_valid = isinstance(_log_level, int)
+logging.basicConfig(
+    level=_log_level if _log_level_valid else logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("button_trigger")
+if not _log_level_valid:
+    logger.warning(f"Unknown BTN_LOGLEVEL '{_log_level_name}' - using WARNING")
+
+from gpiozero import Button, Buzzer, Device
 import keyboard
 import queue
-import select
+import termios
+import tty
+
+# Optional libgpiod bindings for using the button and buzzer lines directly
+try:
+    import gpiod
+    from gpiod.line import Bias, Direction, Edge, Value
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
 
 # Import GPIO lock functionality
 try:
     sys.path.append(str(Path(__file__).parent / "src"))
-    from src.gpio_lock import GPIOLock
+    from src.gpio_lock import GPIOLock, sleep_until
     from src.config import GPIO_LOCK_PIN, LOCK_UNLOCK_DURATION, ENABLE_GPIO_LOCK, GPIO_LOCK_ACTIVE_HIGH
+    from src.config import (AUTH_SUCCESS, AUTH_FAILED, AUTH_NO_FACE, AUTH_CAMERA_ERROR,
+                            AUTH_USER_CANCELLED, AUTH_TIMEOUT)
     LOCK_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: Could not import lock modules: {e}")
-    print("RFID unlock will be simulated only.")
+    logger.warning(f"Could not import lock modules: {e}")
+    logger.warning("RFID unlock will be simulated only.")
     LOCK_AVAILABLE = False
+    # Same values as the AUTH_* exit codes in src/config.py
+    AUTH_SUCCESS = 0
+    AUTH_FAILED = 1
+    AUTH_NO_FACE = 10
+    AUTH_CAMERA_ERROR = 11
+    AUTH_USER_CANCELLED = 12
+    AUTH_TIMEOUT = 13
+    
+    def sleep_until(deadline):
+        """Fallback for src.gpio_lock.sleep_until"""
+        time.sleep(max(0.0, deadline - time.monotonic()))
+
+# Buzzer patterns as ((on_ms, off_ms), ...) steps, keyed by event name
+BUZZER_PATTERNS = {
+    "startup": ((100, 100), (100, 0)),
+    "button_press": ((50, 0),),                      # Short confirmation beep
+    "auth_start": ((100, 100),) * 3,
+    "auth_success": ((300, 200), (300, 0)),          # Two long beeps
+    "no_face": ((400, 0),),                          # Single long beep
+    "rfid_backup_activated": ((150, 100), (150, 300), (200, 0)),
+    "rfid_detected": ((80, 50), (80, 0)),
+    "rfid_success": ((100, 100), (100, 100), (100, 200), (400, 0)),
+    "rfid_unauthorized": ((50, 50),) * 4,
+    "rfid_not_allowed": ((200, 100), (100, 0)),
+    "rfid_timeout": ((200, 200),) * 3,
+    "camera_error": ((200, 300), (100, 200)) * 3,    # Alternating beeps
+    "cooldown_warning": ((200, 0),),
+    "shutdown": ((100, 100),) * 2,
+}
+
+# Authorized RFID card store (relative to the project root the script runs from)
+RFID_CARDS_FILE = Path("authorized_rfid_cards.json")
+
+# Labels of the gpiochip driving the 40-pin header (Pi 5 RP1, Pi 4, older Pis).
+# Its device number differs between models and kernels, so it is looked up by
+# label - the same controller gpiozero's lgpio pin factory uses.
+GPIO_HEADER_CHIP_LABELS = ("pinctrl-rp1", "pinctrl-bcm2711", "pinctrl-bcm2835")
+
+# Console messages for failed authentication results, keyed by AUTH_* code
+AUTH_FAILURE_MESSAGES = {
+    AUTH_CAMERA_ERROR: "📷 Camera failed - activating RFID backup",
+    AUTH_NO_FACE: "⏱️ No face detected - activating RFID backup",
+    AUTH_TIMEOUT: "⏱️ Timeout reached - activating RFID backup",
+    AUTH_USER_CANCELLED: "🛑 Authentication cancelled - activating RFID backup",
+}
+AUTH_FAILURE_DEFAULT_MESSAGE = "❌ Face authentication failed - activating RFID backup"
+
+# Maximum number of pending buzzer patterns - further acknowledgement beeps
+# are dropped so that bursts (e.g. repeated cooldown warnings) do not pile up
+BUZZER_QUEUE_SIZE = 4
+
+# Patterns that only acknowledge input and may be dropped when the queue is
+# full. All others report a result and are always played.
+BUZZER_DROPPABLE = frozenset({"button_press", "cooldown_warning"})
+
+def _find_gpio_chip():
+    """
+    Find the gpiochip device for the 40-pin header
+    
+    BTN_GPIO_CHIP (e.g. /dev/gpiochip4) overrides the lookup by label.
+    
+    Returns:
+        str: Device path, or None if no header chip was found
+    """
+    override = os.environ.get("BTN_GPIO_CHIP")
+    if override:
+        return override
+    for path in sorted(Path("/dev").glob("gpiochip*")):
+        try:
+            if not gpiod.is_gpiochip_device(str(path)):
+                continue
+            with gpiod.Chip(str(path)) as chip:
+                if chip.get_info().label in GPIO_HEADER_CHIP_LABELS:
+                    return str(path)
+        except OSError:
+            continue
+    return None
 
 class FaceRecognitionButtonTrigger:
     def __init__(self, gpio_pin=16, buzzer_pin=26, debounce_time=0.5, cooldown_time=3.0):
@@ -38,68 +146,124 @@ class FaceRecognitionButtonTrigger:
         Args:
             gpio_pin (int): GPIO pin number for the button (default: 16)
             buzzer_pin (int): GPIO pin number for the buzzer (default: 26)
-            debounce_time (float): Minimum time between button presses in seconds (default: 0.5)
+            debounce_time (float): Button bounce time in seconds, handled by the pin driver (default: 0.5)
             cooldown_time (float): Cooldown period after authentication in seconds (default: 3.0)
         """
         self.gpio_pin = gpio_pin
         self.buzzer_pin = buzzer_pin
         self.debounce_time = debounce_time
         self.cooldown_time = cooldown_time
-        self.button = Button(gpio_pin, bounce_time=debounce_time)
-        self.buzzer = Buzzer(buzzer_pin)
+        
+        # Event loop driving button events, the auth worker and RFID handling
+        self._loop = asyncio.new_event_loop()
+        
+        # Header gpiochip for libgpiod line requests (None = use gpiozero only)
+        self._gpio_chip = None
+        if GPIOD_AVAILABLE:
+            self._gpio_chip = _find_gpio_chip()
+            if self._gpio_chip is None:
+                logger.warning("⚠️  GPIO header chip not found - using gpiozero for button and buzzer")
+            else:
+                logger.info(f"Using {self._gpio_chip} for libgpiod GPIO lines")
+        
+        # Request the button line through libgpiod when available so its edge
+        # events can be read straight from the event loop; otherwise use a
+        # gpiozero Button. Either way debouncing is done by the GPIO driver.
+        self.button = None
+        self._button_line = None
+        if self._gpio_chip is not None:
+            self._button_line = self._request_gpio_line(
+                gpio_pin, "button",
+                gpiod.LineSettings(edge_detection=Edge.FALLING,
+                                   bias=Bias.PULL_UP,
+                                   debounce_period=timedelta(seconds=debounce_time))
+            )
+        if self._button_line is None:
+            self.button = Button(gpio_pin, bounce_time=debounce_time)
+        
+        # Drive the buzzer line directly through libgpiod when available (one
+        # ioctl per edge), otherwise fall back to a gpiozero Buzzer
+        self.buzzer = None
+        self._buzzer_line = None
+        if self._gpio_chip is not None:
+            self._buzzer_line = self._request_gpio_line(
+                buzzer_pin, "buzzer",
+                gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE)
+            )
+        if self._buzzer_line is None:
+            self.buzzer = Buzzer(buzzer_pin)
+        
+        # Single buzzer thread playing queued patterns
+        self._buzzer_q = queue.Queue()
+        threading.Thread(target=self._buzzer_loop, daemon=True).start()
+        
+        # Welcome buzzer pattern - queued early so it plays while the rest of
+        # the setup (notably the worker spawn) is still running
+        self._buzzer_play("startup")
+        
         self.is_running_auth = False
         self.rfid_backup_active = False
-        self.last_press_time = 0
-        self.last_auth_end_time = 0
+        # Cooldown gate - cleared after each attempt and re-armed by a loop timer
+        self._armed = True
+        self._cooldown_handle = None
         
         # Initialize GPIO lock for RFID unlock
         if LOCK_AVAILABLE and ENABLE_GPIO_LOCK:
             self.gpio_lock = GPIOLock(gpio_pin=GPIO_LOCK_PIN, unlock_duration=LOCK_UNLOCK_DURATION, active_high=GPIO_LOCK_ACTIVE_HIGH)
-            print(f"🔒 GPIO Lock initialized for RFID backup on pin {GPIO_LOCK_PIN}")
+            logger.info(f"🔒 GPIO Lock initialized for RFID backup on pin {GPIO_LOCK_PIN}")
         else:
             self.gpio_lock = None
             if LOCK_AVAILABLE:
-                print("⚠️  GPIO lock disabled in configuration - RFID unlock will be simulated")
+                logger.warning("⚠️  GPIO lock disabled in configuration - RFID unlock will be simulated")
             else:
-                print("⚠️  GPIO lock not available - RFID unlock will be simulated")
+                logger.warning("⚠️  GPIO lock not available - RFID unlock will be simulated")
         
         # RFID settings
         self.rfid_timeout = 30  # 30 seconds to scan RFID after face auth fails
+        self._rfid_timer = None
         self.rfid_input_buffer = ""
-        self.rfid_input_queue = queue.Queue()
+        self.rfid_input_queue = deque()  # append/popleft are atomic - no locking needed
+        self._rfid_executor = ThreadPoolExecutor(max_workers=1)
         
-        # Load authorized RFID cards
+        # Load authorized RFID cards (changes are written back in batches)
+        self._rfid_save_lock = threading.Lock()
+        self._rfid_save_timer = None
         self.authorized_rfid_cards = self.load_authorized_rfid_cards()
         
+        # Persistent authentication worker (src.main daemon) - the face
+        # recognition stack is imported once here instead of on every press
+        self._cwd = str(Path(__file__).resolve().parent)
+        self._cmd = [sys.executable, "-u", "-m", "src.main", "daemon", "--anti-spoofing"]
+        self._cmd_str = " ".join(self._cmd)
+        self.worker = None
+        self._spawn_worker()
+        
         self.setup_button_events()
         self.setup_rfid_monitoring()
         
-        # Welcome buzzer pattern
-        self.buzzer_startup()
-        
-        print(f"Button trigger initialized on GPIO pin {gpio_pin}")
-        print(f"Buzzer initialized on GPIO pin {buzzer_pin}")
-        print(f"RFID backup system initialized")
-        print(f"Authorized RFID cards: {len(self.authorized_rfid_cards)}")
+        logger.info(f"Button trigger initialized on GPIO pin {gpio_pin}")
+        logger.info(f"Buzzer initialized on GPIO pin {buzzer_pin}")
+        logger.info(f"RFID backup system initialized")
+        logger.info(f"Authorized RFID cards: {len(self.authorized_rfid_cards)}")
         if self.gpio_lock:
             lock_type = "active HIGH" if GPIO_LOCK_ACTIVE_HIGH else "active LOW"
-            print(f"🔒 Physical lock control enabled on GPIO pin {GPIO_LOCK_PIN} ({lock_type})")
-            print(f"🔒 Lock unlock duration: {LOCK_UNLOCK_DURATION} seconds")
+            logger.info(f"🔒 Physical lock control enabled on GPIO pin {GPIO_LOCK_PIN} ({lock_type})")
+            logger.info(f"🔒 Lock unlock duration: {LOCK_UNLOCK_DURATION} seconds")
         else:
-            print("🔒 Physical lock control: DISABLED (simulation mode)")
-        print(f"Debounce time: {debounce_time}s, Cooldown time: {cooldown_time}s")
-        print("Press the button to start face recognition authentication...")
+            logger.info("🔒 Physical lock control: DISABLED (simulation mode)")
+        logger.info(f"Debounce time: {debounce_time}s, Cooldown time: {cooldown_time}s")
+        logger.info("Press the button to start face recognition authentication...")
         
     def load_authorized_rfid_cards(self):
         """Load authorized RFID cards from file"""
-        rfid_file = Path("authorized_rfid_cards.json")
+        rfid_file = RFID_CARDS_FILE
         if rfid_file.exists():
             try:
                 with open(rfid_file, 'r') as f:
                     cards = json.load(f)
                     return cards
             except Exception as e:
-                print(f"Error loading RFID cards: {e}")
+                logger.error(f"Error loading RFID cards: {e}")
         
         # Default cards - add your card numbers here
         default_cards = {
@@ -108,53 +272,85 @@ class FaceRecognitionButtonTrigger:
             # Add your actual RFID card numbers here
         }
         
-        # Save default cards
-        self.save_authorized_rfid_cards(default_cards)
+        # Save default cards - only when there is no file yet, so an unreadable
+        # card file is left in place for the user to fix
+        if not rfid_file.exists():
+            self.save_authorized_rfid_cards(default_cards)
         return default_cards
     
     def save_authorized_rfid_cards(self, cards):
         """Save authorized RFID cards to file"""
-        rfid_file = Path("authorized_rfid_cards.json")
+        rfid_file = RFID_CARDS_FILE
+        tmp_file = rfid_file.with_suffix(".json.tmp")
         try:
-            with open(rfid_file, 'w') as f:
+            # Write a temporary file and rename it over the old one, so a crash
+            # mid-write never leaves a truncated card file behind
+            with open(tmp_file, 'w') as f:
                 json.dump(cards, f, indent=2)
+            os.replace(tmp_file, rfid_file)
         except Exception as e:
-            print(f"Error saving RFID cards: {e}")
+            logger.error(f"Error saving RFID cards: {e}")
     
     def add_rfid_card(self, card_id, card_name):
         """Add a new authorized RFID card"""
         self.authorized_rfid_cards[card_id] = card_name
+        logger.info(f"Added RFID card: {card_id} ({card_name})")
+        
+        # Coalesce bursts of additions into a single write
+        with self._rfid_save_lock:
+            if self._rfid_save_timer is None:
+                self._rfid_save_timer = threading.Timer(1.0, self._flush_rfid_cards)
+                self._rfid_save_timer.daemon = True
+                self._rfid_save_timer.start()
+    
+    def _flush_rfid_cards(self):
+        """Write pending RFID card changes to file"""
+        with self._rfid_save_lock:
+            if self._rfid_save_timer is None:
+                return
+            self._rfid_save_timer.cancel()
+            self._rfid_save_timer = None
         self.save_authorized_rfid_cards(self.authorized_rfid_cards)
-        print(f"Added RFID card: {card_id} ({card_name})")
     
     def setup_rfid_monitoring(self):
         """Setup RFID input monitoring"""
+        # Put the terminal in cbreak mode so reads return per character and the
+        # thread can simply block on stdin until the reader sends something
+        self._stdin_attrs = None
+        if sys.stdin.isatty():
+            self._stdin_attrs = termios.tcgetattr(sys.stdin.fileno())
+            tty.setcbreak(sys.stdin.fileno())
+        
         def rfid_input_thread():
             """Monitor for RFID input in a separate thread"""
-            current_input = ""
+            fd = sys.stdin.fileno()
+            current_input = bytearray()
             
             while True:
                 try:
-                    # Monitor stdin for RFID input (acts like keyboard)
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        char = sys.stdin.read(1)
-                        
-                        if char.isdigit():
-                            current_input += char
+                    # Block on stdin for RFID input (acts like keyboard) - one
+                    # read usually returns a whole card ID
+                    data = os.read(fd, 64)
+                    if not data:
+                        break  # stdin closed - no RFID reader attached
+                    
+                    for byte in data:
+                        if 48 <= byte <= 57:  # Digit
+                            current_input.append(byte)
                             # RFID reader sends 10 digits
                             if len(current_input) == 10:
-                                self.rfid_input_queue.put(current_input)
-                                current_input = ""
-                        elif char in ['\n', '\r']:
+                                self.rfid_input_queue.append(current_input.decode())
+                                self._loop.call_soon_threadsafe(self._on_rfid_input)
+                                current_input.clear()
+                        elif byte in (10, 13):
                             # End of RFID input
                             if len(current_input) >= 8:  # Minimum valid length
-                                self.rfid_input_queue.put(current_input)
-                            current_input = ""
-                        elif not char.isprintable():
+                                self.rfid_input_queue.append(current_input.decode())
+                                self._loop.call_soon_threadsafe(self._on_rfid_input)
+                            current_input.clear()
+                        elif byte < 32 or byte == 127:
                             # Reset on non-printable characters
-                            current_input = ""
-                            
-                    time.sleep(0.01)
+                            current_input.clear()
                 except:
                     time.sleep(0.1)
         
@@ -162,458 +358,455 @@ class FaceRecognitionButtonTrigger:
         rfid_thread = threading.Thread(target=rfid_input_thread, daemon=True)
         rfid_thread.start()
     
+    def _on_rfid_input(self):
+        """Hand queued RFID scans to the RFID worker thread"""
+        # Unlocking blocks for the unlock duration - keep it off the loop. The
+        # single-thread executor keeps scans handled one at a time, in order.
+        fut = self._loop.run_in_executor(self._rfid_executor, self.process_rfid_input)
+        fut.add_done_callback(self._log_rfid_error)
+    
+    def _log_rfid_error(self, fut):
+        """Log an exception raised while processing RFID scans"""
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.error(f"❌ Error processing RFID scan: {fut.exception()!r}")
+    
     def process_rfid_input(self):
         """Process RFID input from queue"""
-        while not self.rfid_input_queue.empty():
-            try:
-                rfid_data = self.rfid_input_queue.get_nowait()
-                self.handle_rfid_scan(rfid_data)
-            except queue.Empty:
-                break
+        while self.rfid_input_queue:
+            self.handle_rfid_scan(self.rfid_input_queue.popleft())
     
     def handle_rfid_scan(self, rfid_data):
         """Handle RFID card scan"""
-        print(f"🏷️ RFID card detected: {rfid_data}")
-        self.buzzer_rfid_detected()
+        logger.info(f"🏷️ RFID card detected: {rfid_data}")
+        self._buzzer_play("rfid_detected")
         
         if not self.rfid_backup_active:
-            print("🚫 RFID backup not active - complete face authentication first")
-            self.buzzer_rfid_not_allowed()
+            logger.info("🚫 RFID backup not active - complete face authentication first")
+            self._buzzer_play("rfid_not_allowed")
             return
         
         # Check if card is authorized
-        if rfid_data in self.authorized_rfid_cards:
-            card_name = self.authorized_rfid_cards[rfid_data]
-            print(f"✅ RFID Authentication successful - {card_name}")
-            self.buzzer_rfid_success()
+        card_name = self.authorized_rfid_cards.get(rfid_data)
+        if card_name is not None:
+            logger.info(f"✅ RFID Authentication successful - {card_name}")
+            self._buzzer_play("rfid_success")
             self.unlock_via_rfid(card_name)
         else:
-            print("❌ RFID card not authorized")
-            self.buzzer_rfid_unauthorized()
+            logger.warning("❌ RFID card not authorized")
+            self._buzzer_play("rfid_unauthorized")
     
     def unlock_via_rfid(self, card_name):
         """Unlock using RFID authentication"""
-        print(f"🔓 Unlocking via RFID - {card_name}")
+        logger.info(f"🔓 Unlocking via RFID - {card_name}")
         
         try:
             if self.gpio_lock:
                 # Use physical GPIO lock - same as face recognition system
                 success = self.gpio_lock.unlock(card_name)
                 if success:
-                    print("🎉 Lock opened via RFID backup authentication!")
+                    logger.info("🎉 Lock opened via RFID backup authentication!")
                 else:
-                    print("❌ Failed to unlock via RFID - lock operation failed")
-                    self.buzzer_camera_error()  # Use error buzzer pattern
+                    logger.error("❌ Failed to unlock via RFID - lock operation failed")
+                    self._buzzer_play("camera_error")  # Use error buzzer pattern
             else:
                 # Fallback to simulation if GPIO lock is not available
-                print("🔓 SIMULATED RFID UNLOCK: Access granted")
-                print(f"   (Would unlock for {LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0} seconds)")
+                logger.info("🔓 SIMULATED RFID UNLOCK: Access granted")
+                logger.info(f"   (Would unlock for {LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0} seconds)")
                 # Simulate the unlock duration
                 time.sleep(LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0)
-                print("🔒 Simulated lock secured again")
-                print("🎉 Simulated lock opened via RFID backup authentication!")
+                logger.info("🔒 Simulated lock secured again")
+                logger.info("🎉 Simulated lock opened via RFID backup authentication!")
                 
         except Exception as e:
-            print(f"❌ Error during RFID unlock operation: {e}")
-            self.buzzer_camera_error()
+            logger.error(f"❌ Error during RFID unlock operation: {e}")
+            self._buzzer_play("camera_error")
         
         # Reset states
         self.rfid_backup_active = False
-        self.last_auth_end_time = time.time()
+        if self._rfid_timer:
+            self._rfid_timer.cancel()
+        self._loop.call_soon_threadsafe(self._start_cooldown)
     
     def unlock_via_face_recognition(self):
         """Unlock using face recognition authentication"""
-        print("🔓 Unlocking via face recognition")
+        logger.info("🔓 Unlocking via face recognition")
         
         try:
             if self.gpio_lock:
                 # Use physical GPIO lock - same as RFID system
                 success = self.gpio_lock.unlock("Face Recognition")
                 if success:
-                    print("🎉 Lock opened via face recognition authentication!")
+                    logger.info("🎉 Lock opened via face recognition authentication!")
                 else:
-                    print("❌ Failed to unlock via face recognition - lock operation failed")
-                    self.buzzer_camera_error()  # Use error buzzer pattern
+                    logger.error("❌ Failed to unlock via face recognition - lock operation failed")
+                    self._buzzer_play("camera_error")  # Use error buzzer pattern
             else:
                 # Fallback to simulation if GPIO lock is not available
-                print("🔓 SIMULATED FACE UNLOCK: Access granted")
-                print(f"   (Would unlock for {LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0} seconds)")
+                logger.info("🔓 SIMULATED FACE UNLOCK: Access granted")
+                logger.info(f"   (Would unlock for {LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0} seconds)")
                 # Simulate the unlock duration
                 time.sleep(LOCK_UNLOCK_DURATION if LOCK_AVAILABLE else 5.0)
-                print("🔒 Simulated lock secured again")
-                print("🎉 Simulated lock opened via face recognition authentication!")
+                logger.info("🔒 Simulated lock secured again")
+                logger.info("🎉 Simulated lock opened via face recognition authentication!")
                 
         except Exception as e:
-            print(f"❌ Error during face recognition unlock operation: {e}")
-            self.buzzer_camera_error()
+            logger.error(f"❌ Error during face recognition unlock operation: {e}")
+            self._buzzer_play("camera_error")
         
-        # Set auth end time for cooldown
-        self.last_auth_end_time = time.time()
+        # Start the cooldown from the end of the unlock
+        self._loop.call_soon_threadsafe(self._start_cooldown)
     
     def activate_rfid_backup(self):
         """Activate RFID backup mode after face auth failure"""
         self.rfid_backup_active = True
-        print("🏷️ RFID backup activated - scan your card within 30 seconds")
-        self.buzzer_rfid_backup_activated()
-        
-        # Start timeout timer
-        def rfid_timeout():
-            time.sleep(self.rfid_timeout)
-            if self.rfid_backup_active:
-                self.rfid_backup_active = False
-                print("⏱️ RFID backup timeout - please try again")
-                self.buzzer_rfid_timeout()
-        
-        threading.Thread(target=rfid_timeout, daemon=True).start()
+        logger.info("🏷️ RFID backup activated - scan your card within 30 seconds")
+        self._buzzer_play("rfid_backup_activated")
+        
+        # Start timeout timer - replacing one left over from an earlier window,
+        # which would otherwise close this window early
+        if self._rfid_timer:
+            self._rfid_timer.cancel()
+        self._rfid_timer = threading.Timer(self.rfid_timeout, self._rfid_expire)
+        self._rfid_timer.daemon = True
+        self._rfid_timer.start()
+    
+    def _rfid_expire(self):
+        """Close the RFID backup window when no card was scanned in time"""
+        if self.rfid_backup_active:
+            self.rfid_backup_active = False
+            logger.info("⏱️ RFID backup timeout - please try again")
+            self._buzzer_play("rfid_timeout")
     
     # Buzzer patterns
-    def buzzer_startup(self):
-        """Play startup buzzer pattern"""
-        def startup_pattern():
-            self.buzzer.on()
-            time.sleep(0.1)
-            self.buzzer.off()
-            time.sleep(0.1)
-            self.buzzer.on()
-            time.sleep(0.1)
-            self.buzzer.off()
-        
-        threading.Thread(target=startup_pattern, daemon=True).start()
-        
-    def buzzer_button_press(self):
-        """Play button press confirmation beep"""
-        def beep():
-            self.buzzer.on()
-            time.sleep(0.05)
-            self.buzzer.off()
-        
-        threading.Thread(target=beep, daemon=True).start()
-        
-    def buzzer_auth_start(self):
-        """Play authentication start pattern"""
-        def auth_start_pattern():
-            for _ in range(3):
-                self.buzzer.on()
-                time.sleep(0.1)
-                self.buzzer.off()
-                time.sleep(0.1)
-        
-        threading.Thread(target=auth_start_pattern, daemon=True).start()
-        
-    def buzzer_auth_success(self):
-        """Play authentication success pattern"""
-        def success_pattern():
-            # Two long beeps for success
-            self.buzzer.on()
-            time.sleep(0.3)
-            self.buzzer.off()
-            time.sleep(0.2)
-            self.buzzer.on()
-            time.sleep(0.3)
-            self.buzzer.off()
-        
-        threading.Thread(target=success_pattern, daemon=True).start()
-        
-    def buzzer_no_face_detected(self):
-        """Play no face detected pattern - single long beep"""
-        def no_face_pattern():
-            self.buzzer.on()
-            time.sleep(0.4)
-            self.buzzer.off()
-        
-        threading.Thread(target=no_face_pattern, daemon=True).start()
-        
-    def buzzer_rfid_backup_activated(self):
-        """RFID backup mode activated"""
-        def rfid_activate_pattern():
-            for _ in range(2):
-                self.buzzer.on()
-                time.sleep(0.15)
-                self.buzzer.off()
-                time.sleep(0.1)
-            time.sleep(0.2)
-            self.buzzer.on()
-            time.sleep(0.2)
-            self.buzzer.off()
-        
-        threading.Thread(target=rfid_activate_pattern, daemon=True).start()
-        
-    def buzzer_rfid_detected(self):
-        """RFID card detected"""
-        def rfid_detected_pattern():
-            self.buzzer.on()
-            time.sleep(0.08)
-            self.buzzer.off()
-            time.sleep(0.05)
-            self.buzzer.on()
-            time.sleep(0.08)
-            self.buzzer.off()
-        
-        threading.Thread(target=rfid_detected_pattern, daemon=True).start()
-        
-    def buzzer_rfid_success(self):
-        """RFID authentication successful"""
-        def rfid_success_pattern():
-            for _ in range(3):
-                self.buzzer.on()
-                time.sleep(0.1)
-                self.buzzer.off()
-                time.sleep(0.1)
-            time.sleep(0.1)
-            self.buzzer.on()
-            time.sleep(0.4)
-            self.buzzer.off()
-        
-        threading.Thread(target=rfid_success_pattern, daemon=True).start()
-        
-    def buzzer_rfid_unauthorized(self):
-        """RFID card not authorized"""
-        def rfid_unauth_pattern():
-            for _ in range(4):
-                self.buzzer.on()
-                time.sleep(0.05)
-                self.buzzer.off()
-                time.sleep(0.05)
-        
-        threading.Thread(target=rfid_unauth_pattern, daemon=True).start()
-        
-    def buzzer_rfid_not_allowed(self):
-        """RFID not allowed at this time"""
-        def not_allowed_pattern():
-            self.buzzer.on()
-            time.sleep(0.2)
-            self.buzzer.off()
-            time.sleep(0.1)
-            self.buzzer.on()
-            time.sleep(0.1)
-            self.buzzer.off()
+    def _buzzer_loop(self):
+        """Play queued buzzer patterns one after another"""
+        # Ask for real-time scheduling so beeps are not delayed by the auth
+        # worker's CPU load (pid 0 = this thread); needs root or CAP_SYS_NICE
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+        except (AttributeError, OSError):
+            pass
         
-        threading.Thread(target=not_allowed_pattern, daemon=True).start()
-        
-    def buzzer_rfid_timeout(self):
-        """RFID backup timeout"""
-        def timeout_pattern():
-            for _ in range(3):
-                self.buzzer.on()
-                time.sleep(0.2)
-                self.buzzer.off()
-                time.sleep(0.2)
-        
-        threading.Thread(target=timeout_pattern, daemon=True).start()
-        
-    def buzzer_camera_error(self):
-        """Play camera error pattern - alternating beeps"""
-        def camera_error_pattern():
-            for _ in range(3):
-                self.buzzer.on()
-                time.sleep(0.2)
-                self.buzzer.off()
-                time.sleep(0.3)
-                self.buzzer.on()
-                time.sleep(0.1)
-                self.buzzer.off()
-                time.sleep(0.2)
-        
-        threading.Thread(target=camera_error_pattern, daemon=True).start()
-        
-    def buzzer_cooldown_warning(self):
-        """Play cooldown warning beep"""
-        def warning_beep():
+        while True:
+            pattern = self._buzzer_q.get()
+            try:
+                # Edges are scheduled against absolute deadlines so the time
+                # spent in the pin calls does not stretch the pattern
+                deadline = time.monotonic()
+                for on_ms, off_ms in pattern:
+                    self._bz_on()
+                    deadline += on_ms / 1000
+                    sleep_until(deadline)
+                    self._bz_off()
+                    deadline += off_ms / 1000
+                    sleep_until(deadline)
+            except Exception as e:
+                logger.error(f"Buzzer error: {e}")
+            finally:
+                self._buzzer_q.task_done()
+    
+    def _bz_on(self):
+        """Switch the buzzer on"""
+        if self._buzzer_line:
+            self._buzzer_line.set_value(self.buzzer_pin, Value.ACTIVE)
+        else:
             self.buzzer.on()
-            time.sleep(0.2)
+    
+    def _bz_off(self):
+        """Switch the buzzer off"""
+        if self._buzzer_line:
+            self._buzzer_line.set_value(self.buzzer_pin, Value.INACTIVE)
+        else:
             self.buzzer.off()
-        
-        threading.Thread(target=warning_beep, daemon=True).start()
+    
+    def _buzzer_play(self, name):
+        """Queue the named buzzer pattern, dropping acknowledgement beeps if too many are pending"""
+        if name in BUZZER_DROPPABLE and self._buzzer_q.qsize() >= BUZZER_QUEUE_SIZE:
+            return
+        self._buzzer_q.put_nowait(BUZZER_PATTERNS[name])
         
     def setup_button_events(self):
         """Setup button event handlers"""
-        self.button.when_pressed = self.on_button_pressed
+        if self._button_line:
+            self._loop.add_reader(self._button_line.fd, self._on_button_edge)
+        else:
+            # gpiozero calls back from its own thread - hop onto the loop
+            self.button.when_pressed = lambda: self._loop.call_soon_threadsafe(self.on_button_pressed)
+    
+    def _on_button_edge(self):
+        """Read pending edge events from the button line"""
+        if self._button_line.read_edge_events():
+            self.on_button_pressed()
+        
+    def _start_cooldown(self):
+        """Disarm the button for cooldown_time (runs on the event loop)"""
+        if self._cooldown_handle:
+            self._cooldown_handle.cancel()
+        self._armed = False
+        self._cooldown_handle = self._loop.call_later(self.cooldown_time, self._rearm)
+    
+    def _rearm(self):
+        """Cooldown over - accept button presses again"""
+        self._armed = True
+        self._cooldown_handle = None
         
     def on_button_pressed(self):
-        """Handle button press event with debouncing and cooldown protection"""
-        current_time = time.time()
-        
-        # Check if we're in cooldown period after last authentication
-        if current_time - self.last_auth_end_time < self.cooldown_time:
-            remaining_cooldown = self.cooldown_time - (current_time - self.last_auth_end_time)
-            print(f"⏱️ Cooldown active - please wait {remaining_cooldown:.1f} more seconds")
-            self.buzzer_cooldown_warning()
-            return
-        
-        # Check if authentication is already running
-        if self.is_running_auth:
-            print("🚫 Authentication already running - button press ignored")
-            self.buzzer_cooldown_warning()
-            return
-            
-        # Check debounce time (additional protection against rapid presses)
-        if current_time - self.last_press_time < self.debounce_time:
-            print("🚫 Button press too fast - ignored (debounce protection)")
+        """Handle button press event with cooldown protection (debouncing is done by the pin driver)"""
+        # Ignore presses during cooldown or while authentication is running
+        if not self._armed or self.is_running_auth:
+            if self.is_running_auth:
+                logger.info("🚫 Authentication already running - button press ignored")
+            else:
+                remaining = self._cooldown_handle.when() - self._loop.time()
+                logger.info(f"⏱️ Cooldown active - please wait {remaining:.1f} more seconds")
+                # The user is about to retry - if the worker died (e.g. killed
+                # after a timeout) restart it now so it is warm when cooldown ends
+                self._ensure_worker()
+            self._buzzer_play("cooldown_warning")
             return
         
         # Valid button press - start authentication
-        self.last_press_time = current_time
-        print(f"✅ Button pressed on GPIO {self.gpio_pin} - starting authentication")
-        self.buzzer_button_press()
-        self.start_authentication()
+        logger.info(f"✅ Button pressed on GPIO {self.gpio_pin} - starting authentication")
+        self.is_running_auth = True
+        self._buzzer_play("button_press")
+        self._loop.create_task(self.start_authentication())
         
-    def start_authentication(self):
-        """Start the face recognition authentication process"""
+    def _request_gpio_line(self, offset, consumer, settings):
+        """
+        Request one line of the header gpiochip through libgpiod
+        
+        Returns:
+            gpiod.LineRequest, or None if the request failed (caller falls back to gpiozero)
+        """
+        try:
+            return gpiod.request_lines(self._gpio_chip, consumer=consumer, config={offset: settings})
+        except OSError as e:
+            logger.warning(f"⚠️  Could not request {consumer} line via libgpiod: {e}")
+            return None
+    
+    def _spawn_worker(self):
+        """Start the persistent authentication worker process"""
+        logger.debug(f"Starting authentication worker: {self._cmd_str}")
+        logger.debug(f"Working directory: {self._cwd}")
+        
+        self.worker = subprocess.Popen(
+            self._cmd,
+            cwd=self._cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0
+        )
+    
+    def _ensure_worker(self):
+        """Respawn the authentication worker if it has died"""
+        if self.worker is None or self.worker.poll() is not None:
+            if self.worker is not None:
+                logger.warning(f"⚠️ Authentication worker exited with code {self.worker.returncode} - restarting")
+            self._spawn_worker()
+    
+    async def _read_worker_result(self):
+        """
+        Read worker output until the DONE line of the current request
+        
+        Returns:
+            int: AUTH_* result code reported by the worker, or None if it exited
+        """
+        fd = self.worker.stdout.fileno()
+        result = self._loop.create_future()
+        buffer = bytearray()
+        echo = logger.isEnabledFor(logging.INFO)
+        
+        def on_readable():
+            if result.done():
+                return
+            data = os.read(fd, 4096)
+            if not data:
+                result.set_result(None)  # Worker exited
+                return
+            
+            buffer.extend(data)
+            while b"\n" in buffer:
+                line, _, rest = bytes(buffer).partition(b"\n")
+                buffer[:] = rest
+                if line.startswith(b"DONE "):
+                    try:
+                        result.set_result(int(line[5:]))
+                    except ValueError:
+                        # Malformed reply - fail this attempt instead of
+                        # leaving the press waiting for the timeout
+                        logger.error(f"❌ Malformed worker reply: {line!r}")
+                        result.set_result(AUTH_FAILED)
+                    return
+                # Worker progress goes straight to our stderr; echo any other
+                # stdout lines (at INFO level) undecoded, after our own prints
+                if echo:
+                    sys.stdout.flush()
+                    sys.stdout.buffer.write(line + b"\n")
+                    sys.stdout.buffer.flush()
+        
+        self._loop.add_reader(fd, on_readable)
+        try:
+            return await result
+        finally:
+            self._loop.remove_reader(fd)
+    
+    async def start_authentication(self):
+        """Run one face recognition authentication on the persistent worker"""
         try:
             self.is_running_auth = True
             self.rfid_backup_active = False  # Reset RFID backup
-            print("🔄 Starting face recognition authentication with anti-spoofing...")
-            self.buzzer_auth_start()
-            
-            # Get the current working directory to ensure proper module execution
-            current_dir = Path(__file__).parent.absolute()
+            logger.info("🔄 Starting face recognition authentication with anti-spoofing...")
+            self._buzzer_play("auth_start")
             
-            # Command to execute
-            cmd = [sys.executable, "-m", "src.main", "auth", "--anti-spoofing"]
+            # Hand the request to the persistent worker
+            self._ensure_worker()
+            self.worker.stdin.write(b"AUTH\n")
+            self.worker.stdin.flush()
             
-            print(f"Executing command: {' '.join(cmd)}")
-            print(f"Working directory: {current_dir}")
+            status = await asyncio.wait_for(self._read_worker_result(), timeout=120)  # 2 minute timeout
             
-            # Execute the authentication command with output capture
-            result = subprocess.run(
-                cmd,
-                cwd=current_dir,
-                capture_output=True,  # Capture output to analyze results
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
-            
-            # Print the output in real-time style
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
-            
-            # Analyze the output to determine the actual result
-            output_text = result.stdout + result.stderr
-            
-            if result.returncode == 0:
-                # Check what actually happened based on output
-                if "✅ Authentication successful" in output_text:
-                    print("🎉 Face recognition successful!")
-                    self.buzzer_auth_success()
-                    # Unlock the lock for successful face authentication
-                    self.unlock_via_face_recognition()
-                else:
-                    # Face recognition failed - activate RFID backup
-                    if "Failed to start camera" in output_text:
-                        print("📷 Camera failed - activating RFID backup")
-                    elif "Authentication failed: Maximum attempts reached" in output_text:
-                        print("⏱️ No face detected - activating RFID backup")
-                    elif "Authentication failed: Timeout reached" in output_text:
-                        print("⏱️ Timeout reached - activating RFID backup")
-                    else:
-                        print("❌ Face authentication failed - activating RFID backup")
-                    
-                    self.buzzer_no_face_detected()
-                    time.sleep(1)  # Brief pause
-                    self.activate_rfid_backup()
+            if status == AUTH_SUCCESS:
+                logger.info("🎉 Face recognition successful!")
+                self._buzzer_play("auth_success")
+                # Unlock the lock for successful face authentication (blocks
+                # for the unlock duration, so run it off the event loop)
+                await self._loop.run_in_executor(None, self.unlock_via_face_recognition)
+            elif status is None:
+                # stdout closed - make sure the worker is gone, and reap it off the loop
+                self.worker.kill()
+                returncode = await self._loop.run_in_executor(None, self.worker.wait)
+                logger.error(f"❌ Authentication worker exited with return code: {returncode}")
+                logger.info("🏷️ Activating RFID backup due to system error")
+                self.activate_rfid_backup()
             else:
-                print(f"❌ Authentication command failed with return code: {result.returncode}")
-                print("🏷️ Activating RFID backup due to system error")
+                # Face recognition failed - activate RFID backup
+                logger.info(AUTH_FAILURE_MESSAGES.get(status, AUTH_FAILURE_DEFAULT_MESSAGE))
+                
+                self._buzzer_play("no_face")
+                await asyncio.sleep(1)  # Brief pause
                 self.activate_rfid_backup()
                 
-        except subprocess.TimeoutExpired:
-            print("⏱️ Authentication command timed out after 2 minutes")
-            print("🏷️ Activating RFID backup due to timeout")
+        except asyncio.TimeoutError:
+            logger.warning("⏱️ Authentication command timed out after 2 minutes")
+            logger.info("🏷️ Activating RFID backup due to timeout")
+            # The worker is stuck - kill it so the next press respawns it
+            self.worker.kill()
             self.activate_rfid_backup()
         except KeyboardInterrupt:
-            print("\n🛑 Authentication interrupted by user")
+            logger.info("🛑 Authentication interrupted by user")
         except Exception as e:
-            print(f"❌ Error running authentication command: {e}")
-            print("🏷️ Activating RFID backup due to error")
+            logger.error(f"❌ Error running authentication command: {e}")
+            logger.info("🏷️ Activating RFID backup due to error")
             self.activate_rfid_backup()
         finally:
             self.is_running_auth = False
             if not self.rfid_backup_active:
-                self.last_auth_end_time = time.time()
-                print(f"💡 Authentication finished. Cooldown period: {self.cooldown_time}s")
+                self._start_cooldown()
+                logger.info(f"💡 Authentication finished. Cooldown period: {self.cooldown_time}s")
             
     def cleanup(self):
         """Cleanup GPIO resources"""
-        print("Cleaning up GPIO resources...")
-        # Shutdown buzzer pattern
+        logger.info("Cleaning up GPIO resources...")
+        # Shutdown buzzer pattern - wait for it (and anything pending) to finish
         try:
-            for _ in range(2):
-                self.buzzer.on()
-                time.sleep(0.1)
-                self.buzzer.off()
-                time.sleep(0.1)
+            self._buzzer_q.put(BUZZER_PATTERNS["shutdown"], timeout=1)
+            self._buzzer_q.join()
         except:
             pass
         
-        self.button.close()
-        self.buzzer.close()
+        if self._button_line:
+            self._loop.remove_reader(self._button_line.fd)
+            self._button_line.release()
+        else:
+            self.button.close()
+        if self._buzzer_line:
+            self._buzzer_line.release()
+        else:
+            self.buzzer.close()
+        
+        # Stop the authentication worker
+        if self.worker and self.worker.poll() is None:
+            try:
+                self.worker.stdin.write(b"QUIT\n")
+                self.worker.stdin.flush()
+                self.worker.wait(timeout=2)
+            except Exception:
+                self.worker.kill()
+        
+        self._rfid_executor.shutdown(wait=False)
+        self._flush_rfid_cards()
+        
+        # Restore the terminal mode changed for RFID input
+        if self._stdin_attrs:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._stdin_attrs)
         
         # Clean up GPIO lock
         if self.gpio_lock:
             self.gpio_lock.cleanup()
-            print("🔒 GPIO lock cleanup completed")
+            logger.info("🔒 GPIO lock cleanup completed")
         
     def run(self):
         """Main run loop"""
         try:
-            print("🚀 Face Recognition + RFID Backup System Running")
-            print("🔒 Security features enabled:")
-            print(f"   - Button debouncing: {self.debounce_time}s minimum between presses")
-            print(f"   - Authentication cooldown: {self.cooldown_time}s after each attempt")
-            print("   - No queuing of multiple button presses")
+            # Compose the banner and write it in one go
+            banner = [
+                "🚀 Face Recognition + RFID Backup System Running",
+                "🔒 Security features enabled:",
+                f"   - Button debouncing: {self.debounce_time}s minimum between presses",
+                f"   - Authentication cooldown: {self.cooldown_time}s after each attempt",
+                "   - No queuing of multiple button presses",
+            ]
             if self.gpio_lock:
                 lock_type = "active HIGH" if GPIO_LOCK_ACTIVE_HIGH else "active LOW"
-                print(f"🔒 Physical lock control: GPIO pin {GPIO_LOCK_PIN} ({lock_type}), {LOCK_UNLOCK_DURATION}s unlock duration")
+                banner.append(f"🔒 Physical lock control: GPIO pin {GPIO_LOCK_PIN} ({lock_type}), {LOCK_UNLOCK_DURATION}s unlock duration")
             else:
-                print("🔒 Physical lock control: DISABLED (simulation mode)")
-            print("🔊 Buzzer feedback enabled:")
-            print("   - Button press: Short beep")
-            print("   - Auth start: 3 beeps")
-            print("   - Face success: 2 long beeps + UNLOCK")
-            print("   - No face detected: 1 long beep")
-            print("   - RFID backup activated: 2 short + 1 long beep")
-            print("   - RFID detected: 2 quick beeps")
-            print("   - RFID success: 3 beeps + long beep + UNLOCK")
-            print("   - RFID unauthorized: 4 rapid beeps")
-            print("🏷️ RFID Backup System:")
-            print("   - Activates when face recognition fails")
-            print("   - 30-second window to scan card")
-            print("   - Authorized cards unlock the system")
-            print("🔓 Lock Control:")
-            print("   - Face recognition success → Physical lock unlock")
-            print("   - RFID backup success → Physical lock unlock")
+                banner.append("🔒 Physical lock control: DISABLED (simulation mode)")
+            banner += [
+                "🔊 Buzzer feedback enabled:",
+                "   - Button press: Short beep",
+                "   - Auth start: 3 beeps",
+                "   - Face success: 2 long beeps + UNLOCK",
+                "   - No face detected: 1 long beep",
+                "   - RFID backup activated: 2 short + 1 long beep",
+                "   - RFID detected: 2 quick beeps",
+                "   - RFID success: 3 beeps + long beep + UNLOCK",
+                "   - RFID unauthorized: 4 rapid beeps",
+                "🏷️ RFID Backup System:",
+                "   - Activates when face recognition fails",
+                "   - 30-second window to scan card",
+                "   - Authorized cards unlock the system",
+                "🔓 Lock Control:",
+                "   - Face recognition success → Physical lock unlock",
+                "   - RFID backup success → Physical lock unlock",
+            ]
             if self.gpio_lock:
-                print(f"   - Both methods use GPIO pin {GPIO_LOCK_PIN} for {LOCK_UNLOCK_DURATION}s")
+                banner.append(f"   - Both methods use GPIO pin {GPIO_LOCK_PIN} for {LOCK_UNLOCK_DURATION}s")
             else:
-                print("   - Both methods use simulation mode (GPIO disabled)")
-            print("Press Ctrl+C to exit")
-            print("-" * 50)
+                banner.append("   - Both methods use simulation mode (GPIO disabled)")
+            banner += ["Press Ctrl+C to exit", "-" * 50]
+            sys.stdout.write("\n".join(banner) + "\n")
+            sys.stdout.flush()
             
             # Keep the program running and wait for button presses
-            while True:
-                # Process any RFID input
-                self.process_rfid_input()
-                time.sleep(0.1)
+            self._loop.run_forever()
             
         except KeyboardInterrupt:
             print("\n🛑 Shutting down button trigger...")
         finally:
             self.cleanup()
+            self._loop.close()
 
 def main():
     """Main function"""
-    # Check if we're running on a system with GPIO support
+    # Check if we're running on a system with GPIO support - done here rather
+    # than at import, since it opens the GPIO chip
     try:
-        from gpiozero import Device
-        # Test if we can access GPIO
         Device.ensure_pin_factory()
-        print("✅ GPIO support detected")
     except Exception as e:
         print(f"❌ GPIO support not available: {e}")
         print("This script requires a Raspberry Pi or compatible GPIO-enabled device")
         sys.exit(1)
+    print("✅ GPIO support detected")
     
     # Check if the src module exists
     if not Path("src").exists():
@@ -5,27 +5,68 @@ Use this script to add, remove, and manage authorized RFID cards.
 """
 
 import json
+import os
+import re
 import sys
 from pathlib import Path
 
+# Optional faster JSON codec - falls back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Authorized RFID card store
+RFID_CARDS_FILE = Path("authorized_rfid_cards.json")
+
+# Valid card ID: 8-12 digits
+_CARD_RE = re.compile(r"\d{8,12}").fullmatch
+
+def _json_loads(data):
+    """Parse JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Last parsed card file, keyed on (mtime, size, inode). The mtime alone can
+# repeat on coarse-timestamp filesystems; an atomic os.replace rewrite always
+# brings a new inode, so it is never mistaken for the cached file.
+_rfid_cache = {"key": None, "data": None}
+
 def load_rfid_cards():
     """Load authorized RFID cards from file"""
-    rfid_file = Path("authorized_rfid_cards.json")
-    if rfid_file.exists():
-        try:
-            with open(rfid_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading RFID cards: {e}")
-            return {}
-    return {}
+    rfid_file = RFID_CARDS_FILE
+    try:
+        # One stat() both checks for the file and validates the cache
+        st = rfid_file.stat()
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if _rfid_cache["key"] != key:
+            _rfid_cache["data"] = _json_loads(rfid_file.read_bytes())
+            _rfid_cache["key"] = key
+        # Callers edit the returned dict - hand out a copy of the cache
+        return dict(_rfid_cache["data"])
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading RFID cards: {e}")
+        return {}
 
 def save_rfid_cards(cards):
     """Save authorized RFID cards to file"""
-    rfid_file = Path("authorized_rfid_cards.json")
+    rfid_file = RFID_CARDS_FILE
+    tmp_file = rfid_file.with_suffix(".json.tmp")
     try:
-        with open(rfid_file, 'w') as f:
-            json.dump(cards, f, indent=2)
+        # Write a temporary file and rename it over the old one, so a crash
+        # mid-write never leaves a truncated card file behind
+        tmp_file.write_bytes(_json_dumps(cards))
+        os.replace(tmp_file, rfid_file)
         print(f"✅ RFID cards saved to {rfid_file}")
         return True
     except Exception as e:
@@ -56,12 +97,8 @@ def add_card(cards):
         card_id = input("Card ID (10 digits): ").strip()
         
         # Validate card ID
-        if not card_id.isdigit():
-            print("❌ Card ID must contain only digits")
-            return False
-        
-        if len(card_id) < 8 or len(card_id) > 12:
-            print("❌ Card ID must be 8-12 digits long")
+        if not _CARD_RE(card_id):
+            print("❌ Card ID must be 8-12 digits long and contain only digits")
             return False
         
         # Check if card already exists
@@ -155,7 +192,7 @@ def test_rfid_reader():
             user_input = input("Waiting for RFID scan: ")
             if user_input.strip():
                 print(f"📥 Received: '{user_input}'")
-                if user_input.isdigit() and 8 <= len(user_input) <= 12:
+                if _CARD_RE(user_input):
                     print("✅ Valid RFID format detected!")
                 else:
                     print("⚠️  Format may not be correct (expected 8-12 digits)")
@@ -167,8 +204,9 @@ def main():
     print("🏷️  RFID Card Setup Utility")
     print("=" * 40)
     
-    # Load existing cards
+    # Load existing cards - changes are kept in memory until saved
     cards = load_rfid_cards()
+    dirty = False
     
     while True:
         print("\n📋 Menu:")
@@ -186,18 +224,16 @@ def main():
             if choice == '1':
                 list_cards(cards)
             elif choice == '2':
-                if add_card(cards):
-                    save_rfid_cards(cards)
+                dirty |= add_card(cards)
             elif choice == '3':
-                if remove_card(cards):
-                    save_rfid_cards(cards)
+                dirty |= remove_card(cards)
             elif choice == '4':
-                if clear_all_cards(cards):
-                    save_rfid_cards(cards)
+                dirty |= clear_all_cards(cards)
             elif choice == '5':
                 test_rfid_reader()
             elif choice == '6':
-                save_rfid_cards(cards)
+                if dirty:
+                    save_rfid_cards(cards)
                 print("👋 Setup complete!")
                 break
             elif choice == '0':
@@ -208,6 +244,9 @@ def main():
                 
         except KeyboardInterrupt:
             print("\n👋 Setup interrupted")
+            # Keep changes made so far
+            if dirty:
+                save_rfid_cards(cards)
             break
         except Exception as e:
             print(f"❌ Error: {e}")
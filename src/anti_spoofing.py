@@ -6,55 +6,117 @@ during authentication attempts.
 """
 
 import cv2
+import queue
+import threading
+import time
 import numpy as np
 from typing import Dict, List, Tuple, Union, Optional, Any
 from deepface import DeepFace
+try:
+    from deepface.modules import modeling
+    FASNET_AVAILABLE = True
+except ImportError:
+    FASNET_AVAILABLE = False
+from .config import SPOOF_DETECTION_INTERVAL
 from .utils import logger, draw_recognition_feedback_on_frame, draw_enhanced_anti_spoofing_feedback, resize_for_deepface
 
-# Default threshold for live detection
-LIVE_THRESHOLD = 0.5
+# Face boxes are snapped to this grid (pixels) when looking up cached liveness
+# results, so small jitter between frames still hits the cache
+SPOOF_CACHE_GRID = 32
 
 class AntiSpoofing:
-    def __init__(self, min_confidence: float = 0.9):
+    def __init__(self, min_confidence: float = 0.9,
+                 detection_interval: float = SPOOF_DETECTION_INTERVAL):
         """
         Initialize anti-spoofing detector
         
         Args:
             min_confidence: Minimum confidence threshold for anti-spoofing (0-1)
+            detection_interval: Seconds a face's liveness result is reused before
+                                DeepFace is run on it again
         """
         self.min_confidence = min_confidence
+        self.detection_interval = detection_interval
+        # (name, grid row, grid column) -> (is_real, monotonic timestamp)
+        self._spoof_cache: Dict[Tuple[str, int, int], Tuple[bool, float]] = {}
+        # Newest (results, error) from the demo detector thread, guarded by _result_lock
+        self._result_lock = threading.Lock()
+        self._latest_result = ([], None)
+        
+        # Load the spoof model up front so known face regions can be scored
+        # directly. build_model returns DeepFace's cached instance, the same one
+        # extract_faces(anti_spoofing=True) uses, so is_live, check_image and
+        # the demo share it and none of them pays the load on its first frame.
+        self._fasnet = None
+        if FASNET_AVAILABLE:
+            try:
+                self._fasnet = modeling.build_model(task="spoofing", model_name="Fasnet")
+            except Exception as e:
+                logger.warning(f"Could not load FasNet model, using DeepFace.extract_faces: {e}")
+        
+        # Haar cascade for whole-frame checks, run on a grayscale copy so the
+        # detector reads one channel instead of three
+        self._cascade = None
+        if self._fasnet is not None:
+            try:
+                cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+                if not cascade.empty():
+                    self._cascade = cascade
+            except AttributeError:
+                # OpenCV builds without cv2.data (e.g. distro packages)
+                pass
         logger.info(f"Anti-spoofing initialized with confidence threshold: {min_confidence}")
     
-    def set_threshold(self, t: float):
-        """Set the threshold for live detection"""
-        global LIVE_THRESHOLD
-        LIVE_THRESHOLD = t
-        logger.info(f"Anti-spoofing threshold set to: {t}")
+    def _score_frame(self, frame: np.ndarray) -> List[Tuple[Tuple[int, int, int, int], bool]]:
+        """Detect faces in a frame and score each one, as ((x, y, w, h), is_real) pairs"""
+        if self._cascade is not None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Same parameters DeepFace's opencv backend uses
+            faces = self._cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=10)
+            results = []
+            for (x, y, w, h) in faces:
+                facial_area = (int(x), int(y), int(w), int(h))
+                is_real, _score = self._fasnet.analyze(img=frame, facial_area=facial_area)
+                results.append((facial_area, bool(is_real)))
+            return results
+        
+        # Use OpenCV detector for faster processing on Raspberry Pi
+        face_objs = DeepFace.extract_faces(
+            img_path=frame, 
+            anti_spoofing=True,
+            enforce_detection=False,
+            detector_backend="opencv"  # Use lighter OpenCV detector for Pi
+        )
+        
+        results = []
+        for face_obj in face_objs:
+            facial_area = face_obj.get("facial_area", {})
+            x = facial_area.get("x", 0)
+            y = facial_area.get("y", 0)
+            w = facial_area.get("w", 0)
+            h = facial_area.get("h", 0)
+            # DeepFace's anti_spoofing adds the 'is_real' property
+            results.append(((x, y, w, h), face_obj.get("is_real", False)))
+        return results
     
     def is_live(self, frame) -> bool:
         """Determine if a frame contains a live face"""
         try:
             # Resize frame for better performance on Raspberry Pi
             resized_frame = resize_for_deepface(frame)
-            logger.info(f"Resized frame from {frame.shape[1]}x{frame.shape[0]} to 320x240 for DeepFace")
+            # Lazy %-formatting: this runs every frame and is normally filtered out
+            logger.debug("Resized frame from %dx%d to 320x240 for DeepFace", frame.shape[1], frame.shape[0])
             
-            # Use OpenCV detector for faster processing on Raspberry Pi
-            face_objs = DeepFace.extract_faces(
-                img_path=resized_frame, 
-                anti_spoofing=True,
-                enforce_detection=False,
-                detector_backend="opencv"  # Use lighter OpenCV detector for Pi
-            )
+            faces = self._score_frame(resized_frame)
             
-            if not face_objs:
+            if not faces:
                 logger.warning("No faces detected in anti-spoofing check")
                 return False
             
-            # Check if any face is real - DeepFace's anti_spoofing adds 'is_real' property
-            for face_obj in face_objs:
-                if "is_real" in face_obj and face_obj["is_real"]:
-                    logger.info("Live face detected")
-                    return True
+            # Check if any face is real
+            if any(is_real for _area, is_real in faces):
+                logger.debug("Live face detected")
+                return True
             
             # If no face determined to be real, return False
             logger.warning("No live face detected - possible spoofing attempt")
@@ -66,17 +128,28 @@ class AntiSpoofing:
             # This prevents authentication when anti-spoofing fails
             return False
     
-    def check_image(self, img_path: str) -> bool:
+    def check_image(self, img_path: Union[str, bytes, np.ndarray]) -> bool:
         """
         Check if faces in an image are real
         
         Args:
-            img_path: Path to image file
+            img_path: Path to image file, encoded image bytes (e.g. an uploaded
+                      JPEG), or an already decoded BGR image
             
         Returns:
             True if all faces are real, False if any are fake or none detected
         """
+        # Describe the source for log messages without dumping image data
+        source = img_path if isinstance(img_path, str) else f"<{type(img_path).__name__}>"
         try:
+            # Encoded bytes are decoded in memory - no temporary file round trip
+            if isinstance(img_path, (bytes, bytearray, memoryview)):
+                img = cv2.imdecode(np.frombuffer(img_path, np.uint8), cv2.IMREAD_COLOR)
+                if img is None:
+                    logger.warning("Could not decode image bytes for anti-spoofing check")
+                    return False
+                img_path = img
+            
             # If img_path is a string (file path), read and resize the image
             if isinstance(img_path, str):
                 # Load the image
@@ -112,13 +185,38 @@ class AntiSpoofing:
             # Check if all faces are real using the direct is_real property
             all_real = all(face_obj.get("is_real", False) for face_obj in face_objs)
             if not all_real:
-                logger.warning(f"Fake face detected in image: {img_path}")
+                logger.warning(f"Fake face detected in image: {source}")
             
             return all_real
         except Exception as e:
-            logger.error(f"Error in anti-spoofing check for image {img_path}: {e}")
+            logger.error(f"Error in anti-spoofing check for image {source}: {e}")
             return False
     
+    def _region_is_real(self, frame: np.ndarray,
+                        face_location: Tuple[int, int, int, int]) -> bool:
+        """Run the spoof model on a known face region given as (top, right, bottom, left)"""
+        top, right, bottom, left = face_location
+        
+        if self._fasnet is not None:
+            # FasNet crops its own context around the box, so give it the whole frame
+            is_real, _score = self._fasnet.analyze(img=frame, facial_area=(left, top, right - left, bottom - top))
+            return bool(is_real)
+        
+        # Resize face for better performance - smaller size for face regions
+        resized_face = resize_for_deepface(frame[top:bottom, left:right], width=160, height=160)
+        
+        # The crop is already the face, so skip DeepFace's own detector pass
+        face_objs = DeepFace.extract_faces(
+            img_path=resized_face, 
+            anti_spoofing=True,
+            enforce_detection=False,
+            detector_backend="skip",
+            align=False
+        )
+        
+        # Check if the face is real directly with is_real property
+        return any(face_obj.get("is_real", False) for face_obj in face_objs)
+    
     def check_face_region(self, frame: np.ndarray, 
                          face_location: Tuple[int, int, int, int]) -> bool:
         """
@@ -132,28 +230,8 @@ class AntiSpoofing:
             True if face is real, False if fake or error occurred
         """
         try:
-            top, right, bottom, left = face_location
-            face_img = frame[top:bottom, left:right]
-            
-            # Resize face for better performance - smaller size for face regions
-            resized_face = resize_for_deepface(face_img, width=160, height=160)
-            
-            # Use OpenCV detector for faster processing on Raspberry Pi
-            face_objs = DeepFace.extract_faces(
-                img_path=resized_face, 
-                anti_spoofing=True,
-                enforce_detection=False,
-                detector_backend="opencv"  # Faster for Pi
-            )
-            
-            if not face_objs:
-                logger.warning("No faces detected in region during anti-spoofing check")
-                return False
-            
-            # Check if the face is real using the 'is_real' property
-            for face_obj in face_objs:
-                if "is_real" in face_obj and face_obj["is_real"]:
-                    return True
+            if self._region_is_real(frame, face_location):
+                return True
             
             logger.warning("Fake face detected in frame region")
             return False
@@ -177,51 +255,91 @@ class AntiSpoofing:
         if not face_results:
             return []
             
-        frame_copy = frame.copy()
         verified_results = []
+        now = time.monotonic()
         
         for bbox, name, confidence in face_results:
-            # Extract face region for anti-spoofing check
-            top, right, bottom, left = bbox
-            face_img = frame_copy[top:bottom, left:right]
+            # Only perform detailed anti-spoofing on recognized faces -
+            # unknown faces just pass through
+            if name == "Unknown":
+                verified_results.append((bbox, name, confidence))
+                continue
             
-            # Only perform detailed anti-spoofing on recognized faces
-            if name != "Unknown":
+            # Liveness does not change between adjacent frames - reuse a
+            # recent result for the same face instead of running DeepFace
+            top, right, bottom, left = bbox
+            cache_key = (name, top // SPOOF_CACHE_GRID, left // SPOOF_CACHE_GRID)
+            cached = self._spoof_cache.get(cache_key)
+            if cached is not None and now - cached[1] < self.detection_interval:
+                is_real = cached[0]
+            else:
                 try:
-                    # Resize face for better performance
-                    resized_face = resize_for_deepface(face_img, width=160, height=160)
-                    
-                    # Use OpenCV detector for faster processing on Raspberry Pi
-                    face_objs = DeepFace.extract_faces(
-                        img_path=resized_face, 
-                        anti_spoofing=True,
-                        enforce_detection=False,
-                        detector_backend="opencv"  # Faster for Pi
-                    )
-                    
-                    # Check if the face is real directly with is_real property
-                    is_real = any(face_obj.get("is_real", False) for face_obj in face_objs)
-                    
-                    if is_real:
-                        verified_results.append((bbox, name, confidence))
-                    else:
-                        verified_results.append((bbox, "Fake", confidence))
-                        logger.warning(f"Fake face detected for {name}")
+                    is_real = self._region_is_real(frame, bbox)
+                    self._spoof_cache[cache_key] = (is_real, now)
                 except Exception as e:
                     logger.error(f"Anti-spoofing check failed: {e}")
                     # Mark as fake on errors for better security (fail-closed approach)
                     verified_results.append((bbox, "Fake", confidence))
                     logger.warning(f"Anti-spoofing error for {name} - marking as fake for security")
-            else:
-                # For unknown faces, just pass through
+                    continue
+                
+            if is_real:
                 verified_results.append((bbox, name, confidence))
+            else:
+                verified_results.append((bbox, "Fake", confidence))
+                logger.warning(f"Fake face detected for {name}")
+        
+        # Drop expired entries so faces that left the frame do not pile up
+        self._spoof_cache = {key: entry for key, entry in self._spoof_cache.items()
+                             if now - entry[1] < self.detection_interval}
         
         return verified_results
     
+    def _detect_demo_faces(self, frame: np.ndarray) -> List[Tuple[Tuple[int, int, int, int], str, float]]:
+        """Run the spoof check on a demo frame and return (bbox, "Real"/"Fake", confidence) results"""
+        # Resize frame for better performance on Raspberry Pi
+        resized_frame = resize_for_deepface(frame)
+        
+        results = []
+        for (x, y, w, h), is_real in self._score_frame(resized_frame):
+            # Convert to top, right, bottom, left format
+            bbox = (y, x + w, y + h, x)
+            
+            name = "Real" if is_real else "Fake"
+            confidence = 1.0  # Placeholder
+            
+            results.append((bbox, name, confidence))
+        return results
+    
+    def _demo_worker(self, frame_slot: queue.Queue, should_stop: threading.Event) -> None:
+        """Detector thread for run_demo - analyzes the newest frame and publishes the result"""
+        while not should_stop.is_set():
+            try:
+                frame = frame_slot.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            started = time.monotonic()
+            try:
+                result = (self._detect_demo_faces(frame), None)
+            except Exception as e:
+                logger.error(f"Error in anti-spoofing demo: {e}")
+                result = (None, e)
+            
+            with self._result_lock:
+                self._latest_result = result
+            
+            # Keep showing this result until the detection interval has passed
+            should_stop.wait(self.detection_interval - (time.monotonic() - started))
+    
     def run_demo(self, camera_index: int = 0) -> None:
         """
         Run a demonstration of the anti-spoofing detection
         
+        DeepFace runs on a background thread that always takes the newest
+        frame, so the preview keeps up with the camera and shows the most
+        recent result instead of stalling on every inference.
+        
         Args:
             camera_index: Camera device index to use
         """
@@ -229,81 +347,85 @@ class AntiSpoofing:
         if not cap.isOpened():
             logger.error(f"Failed to open camera {camera_index}")
             return
+        
+        # Keep only the latest frame queued so reads never return stale frames
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
         logger.info("Starting anti-spoofing demo")
         print("Press 'q' to quit")
         
+        # Single-slot queue: the detector only ever sees the latest frame
+        frame_slot = queue.Queue(maxsize=1)
+        should_stop = threading.Event()
+        with self._result_lock:
+            self._latest_result = ([], None)
+        worker = threading.Thread(target=self._demo_worker, args=(frame_slot, should_stop))
+        worker.daemon = True
+        worker.start()
+        
         try:
             while True:
                 ret, frame = cap.read()
                 if not ret:
                     break
-                    
-                # Detect and analyze faces with anti-spoofing
+                
+                # Replace any frame the detector has not picked up yet
                 try:
-                    # Resize frame for better performance on Raspberry Pi
-                    resized_frame = resize_for_deepface(frame)
-                    
-                    # Use OpenCV detector for faster processing on Raspberry Pi
-                    face_objs = DeepFace.extract_faces(
-                        img_path=resized_frame, 
-                        anti_spoofing=True,
-                        enforce_detection=False,
-                        detector_backend="opencv"  # Faster for Pi
-                    )
-                    
-                    results = []
-                    for face_obj in face_objs:
-                        facial_area = face_obj.get("facial_area", {})
-                        y = facial_area.get("y", 0)
-                        x = facial_area.get("x", 0)
-                        h = facial_area.get("h", 0)
-                        w = facial_area.get("w", 0)
-                        
-                        # Convert to top, right, bottom, left format
-                        bbox = (y, x + w, y + h, x)
-                        
-                        # Check if face is real directly from is_real property
-                        is_real = face_obj.get("is_real", False)
-                        name = "Real" if is_real else "Fake"
-                        confidence = 1.0  # Placeholder
-                        
-                        results.append((bbox, name, confidence))
-                    
-                    # Add FPS counter for performance monitoring
-                    if results:
-                        # Determine liveness status for display
-                        is_live = all(name == "Real" for bbox, name, confidence in results)
-                        annotated_frame = draw_enhanced_anti_spoofing_feedback(frame, results, is_live)
-                        cv2.putText(annotated_frame, f"Found {len(results)} faces", (10, 30), 
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                    else:
-                        annotated_frame = frame.copy()
-                        cv2.putText(annotated_frame, "No faces detected", (10, 30), 
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                    
-                    cv2.imshow("Anti-Spoofing Demo", annotated_frame)
+                    frame_slot.get_nowait()
+                except queue.Empty:
+                    pass
+                frame_slot.put(frame)
+                
+                with self._result_lock:
+                    results, error = self._latest_result
                     
-                except Exception as e:
-                    logger.error(f"Error in anti-spoofing demo: {e}")
+                if error is not None:
                     # Show error on frame for better user feedback
                     error_frame = frame.copy()
                     cv2.putText(error_frame, "Anti-spoofing Error!", (20, 50),
                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-                    cv2.putText(error_frame, str(e)[:50], (20, 90),
+                    cv2.putText(error_frame, str(error)[:50], (20, 90),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
                     cv2.imshow("Anti-Spoofing Demo", error_frame)
+                elif results:
+                    # Determine liveness status for display
+                    is_live = all(name == "Real" for bbox, name, confidence in results)
+                    annotated_frame = draw_enhanced_anti_spoofing_feedback(frame, results, is_live)
+                    cv2.putText(annotated_frame, f"Found {len(results)} faces", (10, 30), 
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                    cv2.imshow("Anti-Spoofing Demo", annotated_frame)
+                else:
+                    annotated_frame = frame.copy()
+                    cv2.putText(annotated_frame, "No faces detected", (10, 30), 
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                    cv2.imshow("Anti-Spoofing Demo", annotated_frame)
                 
                 # Check for quit key
                 if cv2.waitKey(1) & 0xFF == ord('q'):
                     break
                     
         finally:
+            should_stop.set()
+            worker.join(timeout=1.0)
             cap.release()
             cv2.destroyAllWindows()
             logger.info("Anti-spoofing demo ended")
 
+_default_detector: Optional[AntiSpoofing] = None
+
+def get_default() -> AntiSpoofing:
+    """
+    Return the shared AntiSpoofing instance, creating it on first use
+    
+    Lets repeated callers (e.g. every attempt of the auth daemon) reuse one
+    loaded spoof model instead of building a new detector each time.
+    """
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = AntiSpoofing()
+    return _default_detector
+
 # Simple command-line test if run directly
 if __name__ == "__main__":
-    spoof_detector = AntiSpoofing()
+    spoof_detector = get_default()
     spoof_detector.run_demo() 
\ No newline at end of file
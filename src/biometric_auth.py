@@ -89,14 +89,13 @@ class BiometricAuth:
                 
                 # Check for anti-spoofing if enabled
                 if self.use_anti_spoofing and results:
-                    # Create a copy for anti-spoofing (we need the original frame for display)
-                    frame_copy = frame.copy()
                     verified_results = []
                     
                     for bbox, name, confidence in results:
-                        # Extract face region for anti-spoofing check
+                        # Extract face region for anti-spoofing check (a view -
+                        # DeepFace only reads it, so the frame needs no copy)
                         top, right, bottom, left = bbox
-                        face_img = frame_copy[top:bottom, left:right]
+                        face_img = frame[top:bottom, left:right]
                         
                         # Only perform anti-spoofing on faces that were recognized
                         if name != "Unknown" and name in self.authorized_users:
@@ -209,14 +208,13 @@ class BiometricAuth:
                     
                     # Perform anti-spoofing check without threading
                     if self.use_anti_spoofing and results:
-                        # Create a copy for anti-spoofing
-                        frame_copy = frame.copy()
                         verified_results = []
                         
                         for bbox, name, confidence in results:
-                            # Extract face region for anti-spoofing check
+                            # Extract face region for anti-spoofing check (a view -
+                            # DeepFace only reads it, so the frame needs no copy)
                             top, right, bottom, left = bbox
-                            face_img = frame_copy[top:bottom, left:right]
+                            face_img = frame[top:bottom, left:right]
                             
                             # Only perform anti-spoofing on faces that were recognized
                             if name != "Unknown" and name in self.authorized_users:
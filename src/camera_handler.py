@@ -84,6 +84,9 @@ class CameraHandler:
             # Set higher framerate
             self.cap.set(cv2.CAP_PROP_FPS, self.fps)
             
+            # Keep only the latest frame queued so reads never return stale frames
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
             # Apply any additional parameters from kwargs
             for key, value in self.kwargs.items():
                 if key.startswith('cv_'):
@@ -21,6 +21,10 @@ TEXT_COLOR = "white"
 DEFAULT_CAMERA_INDEX = 0
 FRAME_WIDTH = 320  # Lower resolution for better performance on Raspberry Pi
 FRAME_HEIGHT = 240  # Lower resolution for better performance on Raspberry Pi
+DETECTION_MAX_WIDTH = 320  # Wider frames are downscaled to this width for face detection
+
+# Anti-spoofing settings
+SPOOF_DETECTION_INTERVAL = 0.25  # Reuse a face's liveness result for this long (seconds)
 
 # GPIO Lock settings
 GPIO_LOCK_PIN = 18  # BCM pin number for lock control (physical pin 12)
@@ -28,6 +32,15 @@ LOCK_UNLOCK_DURATION = 5.0  # How long to keep lock unlocked (seconds)
 ENABLE_GPIO_LOCK = True  # Set to False to disable physical lock and use simulation only
 GPIO_LOCK_ACTIVE_HIGH = False  # Set to True if relay is active HIGH, False if active LOW
 
+# Authentication result codes - exit code of "src.main auth" and the status
+# reported on the "DONE" line of "src.main daemon"
+AUTH_SUCCESS = 0
+AUTH_FAILED = 1
+AUTH_NO_FACE = 10
+AUTH_CAMERA_ERROR = 11
+AUTH_USER_CANCELLED = 12
+AUTH_TIMEOUT = 13
+
 # Head pose settings
 # Multipliers for sensitivity scaling - higher values = more sensitive
 YAW_MULTIPLIER = 30
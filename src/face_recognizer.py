@@ -5,7 +5,7 @@ import face_recognition
 import cv2
 from PIL import Image, ImageDraw
 
-from .config import HOG_MODEL, ENCODINGS_FILE
+from .config import HOG_MODEL, ENCODINGS_FILE, DETECTION_MAX_WIDTH
 from .face_encoder import FaceEncoder
 from .utils import draw_bounding_box, logger, draw_recognition_feedback_on_frame
 
@@ -82,10 +82,19 @@ class FaceRecognizer:
             if image.dtype != np.uint8:
                 image = image.astype(np.uint8)
             
-            # Detect faces
-            face_locations = face_recognition.face_locations(
-                image, model=self.model
-            )
+            # Detect faces - on a downscaled copy if the frame is wider than
+            # DETECTION_MAX_WIDTH, with the boxes scaled back to full size
+            scale = DETECTION_MAX_WIDTH / image.shape[1]
+            if scale < 1:
+                small_image = cv2.resize(image, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                face_locations = [
+                    tuple(int(round(v / scale)) for v in location)
+                    for location in face_recognition.face_locations(small_image, model=self.model)
+                ]
+            else:
+                face_locations = face_recognition.face_locations(
+                    image, model=self.model
+                )
             
             # Create encodings for detected faces
             face_encodings = face_recognition.face_encodings(
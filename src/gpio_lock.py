@@ -20,6 +20,12 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def sleep_until(deadline: float) -> None:
+    """Sleep until a time.monotonic() deadline (returns at once if it has passed)"""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
 class GPIOLock:
     """
     GPIO-based lock controller for door access control
@@ -47,7 +53,9 @@ class GPIOLock:
         if GPIO_AVAILABLE:
             try:
                 # Set the pin factory to lgpio for Raspberry Pi 5 compatibility
-                Device.pin_factory = LGPIOFactory()
+                # (keep an existing lgpio factory so other devices stay valid)
+                if not isinstance(Device.pin_factory, LGPIOFactory):
+                    Device.pin_factory = LGPIOFactory()
                 
                 # Initialize the lock control pin with correct active state
                 self.lock_device = LED(self.gpio_pin, active_high=self.active_high)
@@ -186,6 +194,9 @@ class GPIOLock:
         logger.info(f"Starting lock test cycle with {cycles} cycles ({relay_type})")
         
         try:
+            # Schedule each edge against a fixed deadline so print and GPIO
+            # time does not add drift to the 2s unlock / 1s lock cadence
+            deadline = time.monotonic()
             for i in range(cycles):
                 print(f"\n--- Test Cycle {i+1}/{cycles} ---")
                 
@@ -198,7 +209,8 @@ class GPIOLock:
                     unlock_state = "HIGH" if self.active_high else "LOW"
                     print(f"🔓 Test unlock (simulated) - GPIO Pin {self.gpio_pin} to {unlock_state}")
                 
-                time.sleep(2)
+                deadline += 2
+                sleep_until(deadline)
                 
                 # Lock
                 if self.is_initialized and self.lock_device:
@@ -209,7 +221,8 @@ class GPIOLock:
                     lock_state = "LOW" if self.active_high else "HIGH"
                     print(f"🔒 Test lock (simulated) - GPIO Pin {self.gpio_pin} to {lock_state}")
                 
-                time.sleep(1)
+                deadline += 1
+                sleep_until(deadline)
             
             print(f"\n✅ Lock test cycle completed successfully!")
             logger.info("Lock test cycle completed successfully")
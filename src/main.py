@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
 import cv2
 import numpy as np
 import sys
@@ -13,10 +14,11 @@ from .camera_handler import CameraHandler
 from .head_pose_detector import HeadPoseDetector
 from .head_pose_demo import run_head_pose_demo
 from .guided_registration import register_user_guided
-from .anti_spoofing import AntiSpoofing
+from .anti_spoofing import get_default as get_spoof_detector
 from .decision_gate import DecisionGate
 from .utils import logger, draw_recognition_feedback_on_frame, draw_enhanced_anti_spoofing_feedback, draw_authentication_status, validate_face_size_and_distance, calculate_face_quality_score
-from .config import TRAINING_DIR
+from .config import (TRAINING_DIR, ENCODINGS_FILE, AUTH_SUCCESS, AUTH_FAILED, AUTH_NO_FACE, AUTH_CAMERA_ERROR,
+                     AUTH_USER_CANCELLED, AUTH_TIMEOUT)
 
 def register_new_person(camera_handler, face_encoder):
     """Register a new person by taking their photos and training the model"""
@@ -41,17 +43,33 @@ def register_new_person(camera_handler, face_encoder):
         print("Registration failed or was cancelled.")
         return False
 
-def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False, 
-                   window: int = 15, min_live: int = 12, min_match: int = 12,
-                   live_threshold: float = 0.9):
-    """Run one-time authentication attempt with enhanced anti-spoofing"""
-    auth = BiometricAuth(
+def create_authenticator(model: str = "hog", use_anti_spoofing: bool = False) -> BiometricAuth:
+    """Create the BiometricAuth instance used for authentication attempts"""
+    return BiometricAuth(
         recognition_threshold=0.55, 
         model=model,
         use_anti_spoofing=use_anti_spoofing
     )
+
+def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False, 
+                   window: int = 15, min_live: int = 12, min_match: int = 12,
+                   auth: BiometricAuth = None) -> int:
+    """
+    Run one-time authentication attempt with enhanced anti-spoofing
     
-    # Add all users from training directory as authorized
+    Args:
+        auth: Preloaded authenticator to reuse (created from model and
+            use_anti_spoofing when not given)
+    
+    Returns:
+        One of the AUTH_* result codes from config
+    """
+    if auth is None:
+        auth = create_authenticator(model, use_anti_spoofing)
+    
+    # Add all users from training directory as authorized. A reused
+    # authenticator starts over, so users removed since the last run drop out
+    auth.authorized_users.clear()
     training_dir = TRAINING_DIR
     if training_dir.exists():
         for person_dir in training_dir.iterdir():
@@ -60,9 +78,10 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                 print(f"Authorized user: {person_dir.name}")
     
     # Initialize spoof detector and enhanced decision gate
-    spoof_detector = AntiSpoofing()
+    # Only build the detector when it is used - it loads the spoof model
+    spoof_detector = None
     if use_anti_spoofing:
-        spoof_detector.set_threshold(live_threshold)
+        spoof_detector = get_spoof_detector()
     
     # Enhanced decision gate with quality checks
     min_quality = max(8, window - 7)  # Require at least 8 quality frames, or window-7
@@ -78,11 +97,12 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
     camera = CameraHandler()
     if not camera.start():
         print("Failed to start camera")
-        return
+        return AUTH_CAMERA_ERROR
     
     try:
         start_time = time.time()
         matched_name = "Unknown"  # Fix: Initialize matched_name
+        user_quit = False
         max_frames = 120  # Maximum frames to process (about 4 seconds with default timing)
         frame_count = 0
         
@@ -108,7 +128,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                 
                 # If we have no results but no error was thrown, debug the image
                 if not results and frame_count % 30 == 0:  # Debug every 30 frames
-                    print(f"No faces detected in frame {frame_count}. Frame shape: {frame.shape}, dtype: {frame.dtype}")
+                    logger.debug("No faces detected in frame %d. Frame shape: %s, dtype: %s", frame_count, frame.shape, frame.dtype)
             except Exception as e:
                 print(f"Error during face recognition: {e}")
                 results = []
@@ -131,7 +151,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                     if not is_quality:
                         print(f"⚠️  Face quality too low ({quality_score:.2f}) - potential bypass attempt")
                     else:
-                        print(f"✅ Face quality good ({quality_score:.2f})")
+                        logger.debug("Face quality good (%.2f)", quality_score)
                 else:
                     print(f"⚠️  Face distance/size validation failed - potential bypass attempt")
             
@@ -143,7 +163,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                     print(f"MATCH! Recognized {name} with confidence {confidence:.2f}")
                     break
                 else:
-                    print(f"Found face: {name} with confidence {confidence:.2f}")
+                    logger.debug("Found face: %s with confidence %.2f", name, confidence)
             
             # Check for liveness if anti-spoofing is enabled
             is_live = True  # Default to True if anti-spoofing not enabled
@@ -157,12 +177,14 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                     is_live = True  # Fallback to True on error
             
             # Debug info
-            print(f"Frame {frame_count}/{max_frames}: Match={is_match} ({matched_name}), Live={is_live}, Quality={is_quality}")
+            logger.debug("Frame %d/%d: Match=%s (%s), Live=%s, Quality=%s",
+                         frame_count, max_frames, is_match, matched_name, is_live, is_quality)
             
             # Update enhanced decision gate
             gate_result = gate.update(is_live, is_match, is_quality)
-            status = gate.get_status()
-            print(f"Gate status: {status['live']} live, {status['match']} match, {status['quality']} quality")
+            gate_status = gate.get_status()
+            logger.debug("Gate status: %s live, %s match, %s quality",
+                         gate_status['live'], gate_status['match'], gate_status['quality'])
             
             if gate_result:
                 print(f"✅ Authentication successful - {matched_name}")
@@ -190,11 +212,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                 
                 # Unlock the lock
                 auth.unlock_lock(matched_name)
-                
-                # Exit the program on successful authentication
-                print("Exiting application after successful authentication...")
-                time.sleep(1)  # Brief pause before exit
-                sys.exit(0)
+                return AUTH_SUCCESS
             
             # Show feedback on frame
             try:
@@ -223,12 +241,14 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
             # Check for 'q' key to quit
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 print("User quit the application.")
+                user_quit = True
                 break
                 
             time.sleep(0.03)  # Small delay between frames
         
         # If we got here, authentication was not successful
         if frame_count >= max_frames:
+            status = AUTH_NO_FACE
             print("❌ Authentication failed: Maximum attempts reached")
             print("💡 Tip: Ensure face is at proper distance (not too close or far)")
             
@@ -253,6 +273,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                 time.sleep(0.03)  # Small delay
                 
         elif time.time() - start_time >= 60:
+            status = AUTH_TIMEOUT
             print("❌ Authentication failed: Timeout reached")
             print("💡 Tip: Ensure face is at proper distance (not too close or far)")
             
@@ -276,6 +297,7 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                 
                 time.sleep(0.03)  # Small delay
         else:
+            status = AUTH_USER_CANCELLED if user_quit else AUTH_FAILED
             print("❌ Authentication failed")
             print("💡 Tip: Ensure face is at proper distance (not too close or far)")
             
@@ -298,11 +320,60 @@ def run_authenticate(model: str = "hog", use_anti_spoofing: bool = False,
                         break
                 
                 time.sleep(0.03)  # Small delay
+        
+        return status
     
     finally:
         camera.stop()
         cv2.destroyAllWindows()
 
+def run_auth_daemon(**auth_kwargs):
+    """
+    Serve authentication requests from a parent process over stdin/stdout
+    
+    The interpreter and the face recognition stack are loaded once, then each
+    "AUTH" line on stdin runs one authentication attempt and is answered with
+    a "DONE <code>" line on stdout, where code is one of the AUTH_* result
+    codes. "QUIT" (or EOF) stops the daemon.
+    
+    Args:
+        **auth_kwargs: Keyword arguments forwarded to run_authenticate
+    """
+    # stdout carries only the protocol replies - everything else is printed to
+    # stderr, which the parent inherits, so it reaches the terminal directly
+    # instead of being read and echoed by the parent
+    replies = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        # Load the recognizer (and its encodings) once for all requests,
+        # reloading the encodings only when they change on disk
+        auth = create_authenticator(auth_kwargs.get("model", "hog"),
+                                    auth_kwargs.get("use_anti_spoofing", False))
+        encodings_mtime = ENCODINGS_FILE.stat().st_mtime_ns if ENCODINGS_FILE.exists() else None
+        # Build the shared spoof model now, so the first request does not pay for it
+        if auth_kwargs.get("use_anti_spoofing", False):
+            get_spoof_detector()
+        
+        for line in sys.stdin:
+            command = line.strip()
+            if command == "QUIT":
+                break
+            if command != "AUTH":
+                print(f"Unknown daemon command: {command}", flush=True)
+                continue
+            
+            try:
+                mtime = ENCODINGS_FILE.stat().st_mtime_ns if ENCODINGS_FILE.exists() else None
+                if mtime != encodings_mtime:
+                    auth.recognizer.reload_encodings()
+                    encodings_mtime = mtime
+                status = run_authenticate(auth=auth, **auth_kwargs)
+            except Exception as e:
+                print(f"❌ Error during authentication: {e}", flush=True)
+                status = AUTH_FAILED
+            print(f"DONE {status}", file=replies, flush=True)
+        
+        auth.cleanup()
+
 def run_continuous_monitoring(model: str = "hog", use_anti_spoofing: bool = False):
     """Run continuous monitoring and authentication"""
     auth = BiometricAuth(
@@ -332,7 +403,7 @@ def run_anti_spoofing_demo(camera_index: int = 0):
     print("This will detect if a face is real or fake.")
     print("Press 'q' to quit.")
     
-    spoof_detector = AntiSpoofing()
+    spoof_detector = get_spoof_detector()
     spoof_detector.run_demo(camera_index=camera_index)
 
 def run_lock_test(cycles: int = 3):
@@ -378,6 +449,19 @@ def run_lock_test(cycles: int = 3):
         lock.cleanup()
         print("\nLock test completed.")
 
+def add_auth_arguments(parser):
+    """Add the authentication options shared by the auth and daemon commands"""
+    parser.add_argument("--model", choices=["hog", "cnn"], default="hog",
+                        help="Face detection model to use (hog is faster, cnn is more accurate)")
+    parser.add_argument("--anti-spoofing", action="store_true",
+                        help="Enable anti-spoofing detection to prevent fake face attacks")
+    parser.add_argument("--window", type=int, default=15,
+                        help="Number of recent frames to keep for decision gate")
+    parser.add_argument("--min-live", type=int, default=12,
+                        help="Minimum number of frames that must pass liveness check")
+    parser.add_argument("--min-match", type=int, default=12,
+                        help="Minimum number of frames that must match an authorized user")
+
 def main():
     parser = argparse.ArgumentParser(description="Face Recognition Authentication System")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -390,18 +474,12 @@ def main():
     # Authentication command
     auth_parser = subparsers.add_parser("auth", 
                                       help="Run one-time authentication")
-    auth_parser.add_argument("--model", choices=["hog", "cnn"], default="hog",
-                           help="Face detection model to use (hog is faster, cnn is more accurate)")
-    auth_parser.add_argument("--anti-spoofing", action="store_true",
-                           help="Enable anti-spoofing detection to prevent fake face attacks")
-    auth_parser.add_argument("--window", type=int, default=15,
-                           help="Number of recent frames to keep for decision gate")
-    auth_parser.add_argument("--min-live", type=int, default=12,
-                           help="Minimum number of frames that must pass liveness check")
-    auth_parser.add_argument("--min-match", type=int, default=12,
-                           help="Minimum number of frames that must match an authorized user")
-    auth_parser.add_argument("--live-threshold", type=float, default=0.9,
-                           help="Threshold for liveness detection (0.0-1.0)")
+    add_auth_arguments(auth_parser)
+    
+    # Authentication daemon command (used by the button trigger)
+    daemon_parser = subparsers.add_parser("daemon",
+                                        help="Run authentication on request from stdin (persistent worker)")
+    add_auth_arguments(daemon_parser)
     
     # Monitor command
     monitor_parser = subparsers.add_parser("monitor", 
@@ -446,9 +524,17 @@ def main():
         print("Training complete!")
         
     elif args.command == "auth":
-        run_authenticate(model=args.model, use_anti_spoofing=args.anti_spoofing,
-                        window=args.window, min_live=args.min_live, min_match=args.min_match,
-                        live_threshold=args.live_threshold)
+        status = run_authenticate(model=args.model, use_anti_spoofing=args.anti_spoofing,
+                                  window=args.window, min_live=args.min_live, min_match=args.min_match)
+        if status == AUTH_SUCCESS:
+            # Exit the program on successful authentication
+            print("Exiting application after successful authentication...")
+            time.sleep(1)  # Brief pause before exit
+        sys.exit(status)
+        
+    elif args.command == "daemon":
+        run_auth_daemon(model=args.model, use_anti_spoofing=args.anti_spoofing,
+                        window=args.window, min_live=args.min_live, min_match=args.min_match)
         
     elif args.command == "monitor":
         run_continuous_monitoring(model=args.model, use_anti_spoofing=args.anti_spoofing)
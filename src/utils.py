@@ -638,6 +638,10 @@ def create_flash_effect(frame: np.ndarray, flash_duration: float = 0.1) -> None:
 
 def resize_for_deepface(frame: np.ndarray, width: int = 320, height: int = 240) -> np.ndarray:
     """Resize frame to smaller resolution for faster DeepFace processing on Raspberry Pi."""
+    # INTER_AREA averages source pixels when shrinking - cleaner input for the
+    # spoof model than bilinear sampling of large face crops
+    if frame.shape[1] > width or frame.shape[0] > height:
+        return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
     return cv2.resize(frame, (width, height))
 
 def draw_authentication_status(frame: np.ndarray, 
@@ -10,6 +10,8 @@ export DISPLAY=:0
 export HOME=/home/pillguard
 export USER=pillguard
 export PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin
+# Log granted access and lock events too - face_auth.log is the access log
+export BTN_LOGLEVEL=INFO
 
 # Kill any existing instances
 echo "🛑 Stopping existing processes..."